@@ -109,7 +109,9 @@ for i, (ivp, N) in enumerate(zip(IVPS, Ns)):
     ys_true = jax.vmap(sol_true.evaluate)(ts_dense)
 
     ts = jnp.linspace(ivp.t0, ivp.tmax, N)
-    ys_par, info_par = solve(f=ivp.f, y0=ivp.y0, ts=ts, order=ORDER, init="constant")
+    ys_par, info_par = solve(
+        f=ivp.f, y0=ivp.y0, ts=ts, order=ORDER, init="constant", sequential=False
+    )
     ys_seq, info_seq = solve(
         f=ivp.f, y0=ivp.y0, ts=ts, order=ORDER, init="constant", sequential=True
     )
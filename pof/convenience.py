@@ -1,15 +1,22 @@
+from functools import partial
+
 import jax
 
 import pof.initialization as init
 from pof.observations import *
 from pof.transitions import *
-from pof.utils import _gmul
+from pof.utils import BlockDiagonal, Diagonal, MVNSqrt, _gmul, todense
 
 
 def linearize_observation_model(observation_model, trajectory):
     return jax.vmap(linearize, in_axes=[None, 0])(observation_model, trajectory)
 
 
+def ode_residual(E0, E1, f, x):
+    """Residual of the ODE information operator, E1 x - f(E0 x)"""
+    return E1 @ x - f(None, E0 @ x)
+
+
 def set_up_solver(*, f, y0, ts, order):
     dts = ts[1:] - ts[:-1]
     # assert jnp.all(jnp.isclose(dts, dts[0]))
@@ -21,14 +28,18 @@ def set_up_solver(*, f, y0, ts, order):
     # dtm = TransitionModel(
     #     dtm.F, (1.0 ** jnp.linspace(ts[0], ts[-1], N)[:, None, None]) * dtm.QL
     # )
-    P, PI = nordsieck_preconditioner(iwp, dt)
+    d = y0.shape[0]
+    p, pinv = nordsieck_scaling_1d(iwp, dt)
+    P, PI = Diagonal(jnp.tile(p, d)), Diagonal(jnp.tile(pinv, d))
 
-    E0, E1 = projection_matrix(iwp, 0), projection_matrix(iwp, 1)
-    E0, E1 = E0 @ P, E1 @ P
-    om = NonlinearModel(lambda x: E1 @ x - f(None, E0 @ x))
+    E0, E1 = projection_matrix_1d(iwp, 0), projection_matrix_1d(iwp, 1)
+    E0, E1 = BlockDiagonal(E0 * p, d), BlockDiagonal(E1 * p, d)
+    om = NonlinearModel(partial(ode_residual, E0, E1, f))
 
     x0 = init.taylor_mode_init(f, y0, order)
-    x0 = jax.tree_map(lambda x: PI @ x, x0)
+    # precondition the covariance blockwise; `PI @ x0.chol` would densify it
+    x0 = MVNSqrt(PI @ x0.mean, BlockDiagonal(pinv[:, None] * x0.chol.block, d))
+    x0 = todense(x0)
 
     return {
         "f": f,
@@ -54,9 +65,9 @@ def set_up_solver_no_precond(*, f, y0, ts, order):
 
     E0, E1 = projection_matrix(iwp, 0), projection_matrix(iwp, 1)
 
-    om = observation_model = NonlinearModel(lambda x: E1 @ x - f(None, E0 @ x))
+    om = observation_model = NonlinearModel(partial(ode_residual, E0, E1, f))
 
-    x0 = init.taylor_mode_init(f, y0, order)
+    x0 = todense(init.taylor_mode_init(f, y0, order))
 
     P = PI = jnp.eye(x0.mean.shape[0])
 
@@ -85,6 +96,10 @@ def get_initial_trajectory(setup, method="prior"):
         states = init.constant_init(y0=y0, order=order, ts=ts, f=f)
         states = jax.vmap(_gmul, in_axes=[None, 0])(PI, states)
         return states
+    elif method == "euler":
+        states = init.euler_init(y0=y0, order=order, ts=ts, f=f)
+        states = jax.vmap(_gmul, in_axes=[None, 0])(PI, states)
+        return states
     elif method == "prior":
         states = init.prior_init(f=f, y0=y0, order=order, ts=ts)
         return states
@@ -1,7 +1,11 @@
 import diffrax
+import equinox as eqx
 import jax.numpy as jnp
 
 
+# filter_jit traces all array leaves (including those of a parametrised `f`) and
+# treats everything else, e.g. `solver` and `max_steps`, as static
+@eqx.filter_jit
 def solve_diffrax(
     f,
     y0,
@@ -12,6 +16,7 @@ def solve_diffrax(
     atol=1e-3,
     max_steps=int(1e6),
     dt=None,
+    dtmax=None,
 ):
     t0, tmax = tspan
     vector_field = lambda t, y, args: f(t, y)
@@ -23,7 +28,7 @@ def solve_diffrax(
         saveat = diffrax.SaveAt(ts=ts)
 
     if dt is None:
-        stepsize_controller = diffrax.PIDController(rtol=rtol, atol=atol)
+        stepsize_controller = diffrax.PIDController(rtol=rtol, atol=atol, dtmax=dtmax)
     else:
         stepsize_controller = diffrax.ConstantStepSize()
 
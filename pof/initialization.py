@@ -9,7 +9,7 @@ import tornadox
 from pof.observations import linearize
 from pof.sequential_filtsmooth.filter import _sqrt_predict, _sqrt_update
 from pof.transitions import IWP, discretize_transitions
-from pof.utils import MVNSqrt
+from pof.utils import BlockDiagonal, Diagonal, MVNSqrt, todense
 
 
 def taylor_mode_init(f, y0, num_derivatives):
@@ -17,7 +17,7 @@ def taylor_mode_init(f, y0, num_derivatives):
     m0, P0 = tornadox.init.TaylorMode()(
         f=f, df=None, y0=y0, t0=0, num_derivatives=num_derivatives
     )
-    m0, P0 = jnp.concatenate(m0.T), jnp.kron(jnp.eye(d), P0)
+    m0, P0 = jnp.concatenate(m0.T), BlockDiagonal(P0, d)
     x0 = MVNSqrt(m0, P0)
     return x0
 
@@ -26,16 +26,14 @@ def uncertain_init(f, y0, num_derivatives, var=1.0):
     d = y0.shape[0]
     q = num_derivatives
 
-    y0 = y0.reshape(-1, 1)
-    dy0 = f(None, y0).reshape(-1, 1)
+    dy0 = f(None, y0)
 
-    m0 = jnp.concatenate([y0, dy0, jnp.zeros((d, (q - 1)))], axis=1)
+    m0 = jnp.zeros((d, q + 1)).at[:, 0].set(y0).at[:, 1].set(dy0)
     m0 = m0.reshape(-1)
-    P0 = jnp.eye(d * (q + 1)) * var
-    for j in range(d):
-        P0 = P0.at[(q + 1) * j, (q + 1) * j].set(0)
-        P0 = P0.at[(q + 1) * j + 1, (q + 1) * j + 1].set(0)
-    x0 = MVNSqrt(m0, jnp.sqrt(P0))
+    # y0 and dy0 are known exactly; only the higher derivatives are uncertain
+    is_known = jnp.arange(q + 1) < 2
+    cholP0 = Diagonal(jnp.where(jnp.tile(is_known, d), 0.0, jnp.sqrt(var)))
+    x0 = MVNSqrt(m0, cholP0)
     return x0
 
 
@@ -46,36 +44,63 @@ def constant_init(*, y0, order, ts, f=True):
         dy0 = f(None, y0)
     else:
         dy0 = jnp.zeros_like(y0)
-    x0 = jnp.concatenate(
-        [y0[:, None], dy0[:, None], jnp.zeros((d, (order - 1)))], axis=1
-    )
-    x0 = x0.reshape(1, -1)
-    traj = jnp.repeat(x0, N, axis=0)
-    _, D = traj.shape
-    cholcovs = jnp.zeros((N, D, D))
+    x0 = jnp.zeros((d, order + 1)).at[:, 0].set(y0).at[:, 1].set(dy0)
+    x0 = x0.reshape(-1)
+    (D,) = x0.shape
+    traj = jnp.broadcast_to(x0, (N, D))
+    cholcovs = jnp.broadcast_to(jnp.zeros((D, D)), (N, D, D))
     return MVNSqrt(traj, cholcovs)
 
 
-def classic_to_init(*, ys, order, f=None):
+def _vector_field_at(f, ys, chunk_size=None):
+    """Evaluate f at all states in ys.
+
+    With `chunk_size`, only that many states are vmapped at a time (sequentially
+    over chunks via `jax.lax.map`), which bounds the peak memory for large N.
+    """
+    if chunk_size is None:
+        return jax.vmap(f, in_axes=(None, 0))(None, ys)
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be a positive integer, got {chunk_size}")
+    N = ys.shape[0]
+    n_chunks = -(-N // chunk_size)
+    pad = n_chunks * chunk_size - N
+    ys = jnp.pad(ys, [(0, pad)] + [(0, 0)] * (ys.ndim - 1), mode="edge")
+    ys = ys.reshape((n_chunks, chunk_size) + ys.shape[1:])
+    dys = jax.lax.map(jax.vmap(lambda y: f(None, y)), ys)
+    return dys.reshape((n_chunks * chunk_size,) + dys.shape[2:])[:N]
+
+
+def classic_to_init(*, ys, order, f=None, chunk_size=None):
     N = ys.shape[0]
     d = ys.shape[-1]
     if f is not None:
-        dys = jax.vmap(f, in_axes=(None, 0))(None, ys)
+        dys = _vector_field_at(f, ys, chunk_size=chunk_size)
     else:
         dys = jnp.zeros_like(ys)
-    traj = jnp.concatenate(
-        [ys[:, :, None], dys[:, :, None], jnp.zeros((N, d, (order - 1)))], axis=2
-    )
+    traj = jnp.zeros((N, d, order + 1)).at[:, :, 0].set(ys).at[:, :, 1].set(dys)
     traj = traj.reshape(N, -1)
     _, D = traj.shape
-    cholcovs = jnp.zeros((N, D, D))
+    cholcovs = jnp.broadcast_to(jnp.zeros((D, D)), (N, D, D))
     return MVNSqrt(traj, cholcovs)
 
 
+def euler_init(*, f, y0, order, ts, chunk_size=None):
+    """Linearize around a single forward-Euler pass instead of a constant"""
+
+    def step(y, dt):
+        y = y + dt * f(None, y)
+        return y, y
+
+    _, ys = jax.lax.scan(step, y0, ts[1:] - ts[:-1])
+    ys = jnp.concatenate([y0[None, :], ys])
+    return classic_to_init(ys=ys, order=order, f=f, chunk_size=chunk_size)
+
+
 def _prior_init(*, x0, dtm):
     states_raw = jax.vmap(lambda F, QL: _sqrt_predict(F, QL, x0))(dtm.F, dtm.QL)
     states_raw = jax.tree_map(
-        lambda a, b: jnp.concatenate((a[None, :], b)), x0, states_raw
+        lambda a, b: jnp.concatenate((a[None, :], b)), todense(x0), states_raw
     )
     return states_raw
 
@@ -129,7 +154,7 @@ def coarse_ekf_init(*, f, y0, order, ts, N=10):
     return interpolated_states
 
 
-def coarse_rk_init(*, f, y0, order, ts, fact=10):
+def coarse_rk_init(*, f, y0, order, ts, fact=10, chunk_size=None):
     coarse_dt = _get_coarse_dt(ts) / fact
 
     tspan = (ts[0], ts[-1])
@@ -137,7 +162,7 @@ def coarse_rk_init(*, f, y0, order, ts, fact=10):
 
     sol_init = solve_diffrax(f, y0, tspan, dt=coarse_dt)
     ys = jax.vmap(sol_init.evaluate)(ts)
-    traj = classic_to_init(ys=ys, f=f, order=order)
+    traj = classic_to_init(ys=ys, f=f, order=order, chunk_size=chunk_size)
     return traj
 
 
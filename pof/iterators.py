@@ -6,32 +6,36 @@ import pof.initialization as init
 from pof.convenience import get_initial_trajectory, set_up_solver
 from pof.observations import AffineModel, linearize, linearize_regularized
 from pof.parallel_filtsmooth import linear_filtsmooth
-from pof.step import ieks_step
+from pof.step import ieks_step, linearize_at_previous_states
 
-fs = linear_filtsmooth
-if jax.lib.xla_bridge.get_backend().platform == "gpu":
-    fs = jax.jit(linear_filtsmooth)
+fs = jax.jit(linear_filtsmooth)
 lom = jax.jit(jax.vmap(linearize, in_axes=[None, 0]), static_argnums=(0,))
 lom_reg = jax.jit(
     jax.vmap(linearize_regularized, in_axes=[None, 0, None]), static_argnums=(0,)
 )
 
 
-def ieks_iterator(*, f, y0, ts, order, init="prior"):
+def ieks_iterator(*, f, y0, ts, order, init="prior", sequential=None):
     setup = set_up_solver(f=f, y0=y0, ts=ts, order=order)
     states = get_initial_trajectory(setup, method=init)
-    iterator = _ieks_iterator(setup["dtm"], setup["om"], setup["x0"], states)
+    iterator = _ieks_iterator(
+        setup["dtm"], setup["om"], setup["x0"], states, sequential=sequential
+    )
     return iterator, setup
 
 
-def _ieks_iterator(dtm, om, x0, init_traj):
-    states, nll, obj, ssq = ieks_step(om=om, dtm=dtm, x0=x0, states=init_traj)
+def _ieks_iterator(dtm, om, x0, init_traj, sequential=None):
+    states, nll, obj, ssq = ieks_step(
+        om=om, dtm=dtm, x0=x0, states=init_traj, sequential=sequential
+    )
     yield states, nll, obj, ssq
 
     while True:
         nll_old, obj_old, states_old = nll, obj, states
 
-        states, nll, obj, ssq = ieks_step(om=om, dtm=dtm, x0=x0, states=states_old)
+        states, nll, obj, ssq = ieks_step(
+            om=om, dtm=dtm, x0=x0, states=states_old, sequential=sequential
+        )
 
         yield states, nll, obj, ssq
 
@@ -76,7 +80,7 @@ def _qpm_ieks_iterator(
     if jnp.all(init_covs == 0):
         init_covs = init._prior_init(x0=x0, dtm=dtm).chol
     # cholR = jax.vmap(lambda H, cP: reg * tria(H @ cP))(dom.H, init_covs)
-    cholR = jax.vmap(lambda cR: jnp.eye(*cR.shape))(dom.cholR)
+    cholR = jax.vmap(lambda b: jnp.eye(b.shape[0]))(dom.b)
 
     dom = jax.vmap(AffineModel)(dom.H, dom.b, reg * cholR / N)
     states, nll, obj, ssq = fs(x0, dtm, dom)
@@ -142,16 +146,18 @@ def admm_ieks_iterator(*, f, y0, ts, order, init="prior"):
 
 def _admm_ieks_iterator(dtm, om, x0, init_traj, rho=1):
     dom = linearize_at_previous_states(om, init_traj)
-    states, nll, obj, _ = linear_filtsmooth(x0, dtm, dom)
+    states, nll, obj, _ = fs(x0, dtm, dom)
     yield states, nll, obj
 
     while True:
-        nll_old, obj_old, mean_old = nll, obj, states.mean
+        nll_old, obj_old, states_old = nll, obj, states
 
-        dom = linearize_at_previous_states(om, states)
-        states, nll, obj, _ = linear_filtsmooth(x0, dtm, dom)
+        dom = linearize_at_previous_states(om, states_old)
+        states, nll, obj, _ = fs(x0, dtm, dom)
 
         yield states, nll, obj
 
-        if pof.convergence_criteria.crit(obj, obj_old, nll, nll_old):
+        if pof.convergence_criteria.crit(
+            obj, obj_old, nll, nll_old, states, states_old
+        ):
             break
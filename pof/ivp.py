@@ -21,7 +21,7 @@ def lotkavolterra(t0=0.0, tmax=7, y0=None, p=None):
     @jax.jit
     def f(_, Y, p=p):
         a, b, c, d = p
-        return jnp.array(
+        return jnp.stack(
             [
                 a * Y[0] - b * Y[0] * Y[1],
                 -c * Y[1] + d * Y[0] * Y[1],
@@ -36,7 +36,7 @@ def vanderpol(t0=0.0, tmax=6.3, y0=None, stiffness_constant=1e1):
 
     @jax.jit
     def f_vanderpol(_, Y, mu=stiffness_constant):
-        return jnp.array([Y[1], mu * ((1.0 - Y[0] ** 2) * Y[1] - Y[0])])
+        return jnp.stack([Y[1], mu * ((1.0 - Y[0] ** 2) * Y[1] - Y[0])])
 
     return tornadox.ivp.InitialValueProblem(f=f_vanderpol, t0=t0, tmax=tmax, y0=y0)
 
@@ -50,7 +50,7 @@ def fitzhughnagumo(t0=0.0, tmax=100.0, y0=None, p=None):
         a, b, tinv, l = p
         v = Y[0]
         w = Y[1]
-        return jnp.array(
+        return jnp.stack(
             [
                 v - (v**3) / 3 - w + l,
                 tinv * (v + a - b * w),
@@ -68,7 +68,7 @@ def rober(t0=0.0, tmax=1e11, y0=None, p=None):
     def f(_, Y, p=p):
         k1, k2, k3 = p
         y1, y2, y3 = Y
-        return jnp.array(
+        return jnp.stack(
             [
                 -k1 * y1 + k3 * y2 * y3,
                 k1 * y1 - k2 * y2**2 - k3 * y2 * y3,
@@ -85,7 +85,7 @@ def rigid_body(t0=0.0, tmax=20.0, y0=None, p=None):
 
     @jax.jit
     def f(_, y, p=p):
-        return jnp.array([p[0] * y[1] * y[2], p[1] * y[0] * y[2], p[2] * y[0] * y[1]])
+        return jnp.stack([p[0] * y[1] * y[2], p[1] * y[0] * y[2], p[2] * y[0] * y[1]])
 
     return tornadox.ivp.InitialValueProblem(f=f, t0=t0, tmax=tmax, y0=y0)
 
@@ -96,7 +96,7 @@ def seir(t0=0.0, tmax=200.0, y0=None, p=None):
 
     @jax.jit
     def f(_, y, p=p):
-        return jnp.array(
+        return jnp.stack(
             [
                 -p[1] * y[0] * y[2] / p[3],
                 p[1] * y[0] * y[2] / p[3] - p[0] * y[1],
@@ -117,11 +117,11 @@ def threebody(t0=0.0, tmax=17.0652165601579625588917206249, y0=None, p=None):
     @jax.jit
     def f(_, y, p=p):
         mu, mp = p[0], 1.0 - p[0]
-        D1 = jnp.linalg.norm(jnp.asarray([y[0] + mu, y[1]])) ** 3.0
-        D2 = jnp.linalg.norm(jnp.asarray([y[0] - mp, y[1]])) ** 3.0
+        D1 = jnp.linalg.norm(jnp.stack([y[0] + mu, y[1]])) ** 3.0
+        D2 = jnp.linalg.norm(jnp.stack([y[0] - mp, y[1]])) ** 3.0
         du0p = y[0] + 2 * y[3] - mp * (y[0] + mu) / D1 - mu * (y[0] - mp) / D2
         du1p = y[1] - 2 * y[2] - mp * y[1] / D1 - mu * y[1] / D2
-        return jnp.asarray([y[2], y[3], du0p, du1p])
+        return jnp.stack([y[2], y[3], du0p, du1p])
 
     return tornadox.ivp.InitialValueProblem(f=f, t0=t0, tmax=tmax, y0=y0)
 
@@ -140,7 +140,7 @@ def henonheiles(t0=0.0, tmax=100.0, y0=None, p=None):
 
     @jax.jit
     def f(_, y, p=p):
-        return jnp.array(
+        return jnp.stack(
             [
                 y[2],
                 y[3],
@@ -2,7 +2,7 @@
 Models in this section are all assumed to be noiseless!
 """
 from functools import partial
-from typing import Callable, NamedTuple
+from typing import Callable, NamedTuple, Optional
 
 import jax
 import jax.numpy as jnp
@@ -25,19 +25,19 @@ class AffineModel(NamedTuple):
 
     The original model (y = f(x)) is approximated by an affine model
     y = H x + b, where H and b are computed from f.
+    `cholR=None` marks the approximation as exact, i.e. noiseless.
     """
 
     H: jnp.ndarray
     b: jnp.ndarray
-    cholR: jnp.ndarray
+    cholR: Optional[jnp.ndarray]
 
 
 @partial(jax.jit, static_argnums=(0,))
 def linearize(f: NonlinearModel, x: MVNSqrt):
     m = x.mean
     res, F_x = f(m), jax.jacfwd(f, 0)(m)
-    cholR = jnp.zeros((res.shape[0], res.shape[0]))
-    return AffineModel(F_x, res - F_x @ m, cholR)
+    return AffineModel(F_x, res - F_x @ m, None)
 
 
 @partial(jax.jit, static_argnums=(0,))
@@ -57,8 +57,7 @@ def linearize_ek0(f: NonlinearModel, x: MVNSqrt):
     q = (m.shape[0] // d) - 1
     _iwp = IWP(wiener_process_dimension=d, num_derivatives=q)
     F_x = E1 = projection_matrix(_iwp, 1)
-    cholR = jnp.zeros((res.shape[0], res.shape[0]))
-    return AffineModel(F_x, res - F_x @ m, cholR)
+    return AffineModel(F_x, res - F_x @ m, None)
 
 
 @partial(jax.jit, static_argnums=(0,))
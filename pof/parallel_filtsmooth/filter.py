@@ -11,6 +11,7 @@ from pof.utils import (
     mvn_loglikelihood,
     objective_function_value,
     tria,
+    tria_joint,
     whiten,
 )
 
@@ -59,8 +60,7 @@ def _get_element(transition_model, observation_model, xs):
 
     m1 = F @ ms  # = 0
     N1_ = tria(jnp.concatenate((F @ Ls, cholQ), axis=1))  # = cholQ
-    Psi_ = jnp.block([[H @ N1_, cholR], [N1_, jnp.zeros((nx, ny))]])
-    Tria_Psi_ = tria(Psi_)
+    Tria_Psi_ = tria_joint(H @ N1_, N1_, cholR)
     Psi11 = Tria_Psi_[:ny, :ny]
     Psi21 = Tria_Psi_[ny:, :ny]
     U = Tria_Psi_[ny:, ny:]
@@ -89,7 +89,9 @@ def _get_obs(transition_model, observation_model, m, cholP):
     predicted_mean = F @ m
     predicted_chol = tria(jnp.concatenate([F @ cholP, cholQ], axis=1))
     obs_mean = H @ predicted_mean + c
-    obs_chol = tria(jnp.concatenate([H @ predicted_chol, cholR], axis=1))
+    # with no rows below HL, tria_joint reduces to tria([H @ predicted_chol, cholR])
+    no_rows = jnp.zeros_like(predicted_chol, shape=(0, predicted_chol.shape[1]))
+    obs_chol = tria_joint(H @ predicted_chol, no_rows, cholR)
     return obs_mean, obs_chol
 
 
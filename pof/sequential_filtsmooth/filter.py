@@ -3,7 +3,7 @@ import jax.numpy as jnp
 from jax.scipy.linalg import solve_triangular
 
 from pof.observations import linearize
-from pof.utils import MVNSqrt, mvn_loglikelihood, tria, whiten
+from pof.utils import MVNSqrt, mvn_loglikelihood, tria, tria_joint, whiten
 
 
 def extended_kalman_filter(
@@ -69,14 +69,12 @@ def _sqrt_predict(F, cholQ, x):
 @jax.jit
 def _sqrt_update(H, cholR, c, x):
     m, cholP = x
-    nx = m.shape[0]
     ny = c.shape[0]
 
     y_hat = H @ m + c
     y_diff = 0 - y_hat
 
-    M = jnp.block([[H @ cholP, cholR], [cholP, jnp.zeros_like(cholP, shape=(nx, ny))]])
-    chol_S = tria(M)
+    chol_S = tria_joint(H @ cholP, cholP, cholR)
 
     cholP = chol_S[ny:, ny:]
 
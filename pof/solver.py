@@ -1,16 +1,58 @@
+from functools import partial
+
 import jax
 import jax.numpy as jnp
 
 import pof.convergence_criteria
 from pof.convenience import get_initial_trajectory, set_up_solver
 from pof.sequential_filtsmooth import filtsmooth as seq_fs
-from pof.step import ieks_step
-from pof.utils import MVNSqrt, _gmul
+from pof.step import default_sequential, ieks_step
+from pof.utils import MVNSqrt, _gmul, merge_arrays, split_arrays
 
 
 def solve(
-    *, f, y0, ts, order, init="prior", calibrate=True, maxiters=10_000, sequential=False
+    *, f, y0, ts, order, init="prior", calibrate=True, maxiters=10_000, sequential=None
 ):
+    """Solve the ODE with the iterated extended Kalman smoother (IEKS).
+
+    `sequential` selects the filter-smoother run in each IEKS iteration: the
+    parallel-in-time one (`False`) or the sequential one (`True`). The default
+    `None` picks from the JAX backend: sequential on CPU, parallel on GPU/TPU.
+    Pass it explicitly to get the same algorithm on every backend.
+    """
+    if sequential is None:
+        sequential = default_sequential()
+    # `f` may carry arrays (e.g. a parametrised module); trace those and keep
+    # only the rest of it static
+    f_arrays, f_static = split_arrays(f)
+    ys, info_dict = _solve(
+        f_arrays,
+        f_static=f_static,
+        y0=y0,
+        ts=ts,
+        order=order,
+        init=init,
+        calibrate=calibrate,
+        maxiters=maxiters,
+        sequential=sequential,
+    )
+    info_dict["calibrated"] = calibrate
+    return ys, info_dict
+
+
+@partial(
+    jax.jit,
+    static_argnames=(
+        "f_static",
+        "order",
+        "init",
+        "calibrate",
+        "maxiters",
+        "sequential",
+    ),
+)
+def _solve(f_arrays, *, f_static, y0, ts, order, init, calibrate, maxiters, sequential):
+    f = merge_arrays(f_arrays, f_static)
     setup = set_up_solver(f=f, y0=y0, ts=ts, order=order)
 
     dtm = setup["dtm"]
@@ -60,13 +102,11 @@ def solve(
         "nll": nll,
         "obj": obj,
         "sigma_squared": ssq,
-        "calibrated": False,
     }
 
     if calibrate:
         chols = ssq**0.5 * states.chol
         states = MVNSqrt(states.mean, chols)
-        info_dict["calibrated"] = True
 
     ys = jax.vmap(_gmul, in_axes=[None, 0])(setup["E0"], states)
 
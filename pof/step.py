@@ -30,8 +30,16 @@ def inflate(state):
     )
 
 
+def default_sequential():
+    # The associative scan has O(log N) span but does more total work than the
+    # sequential scan, so it only pays off on parallel hardware.
+    return jax.default_backend() == "cpu"
+
+
 @partial(jax.jit, static_argnames=["om", "calibrate", "sequential"])
-def ieks_step(*, om, dtm, x0, states, calibrate=True, sequential=False):
+def ieks_step(*, om, dtm, x0, states, calibrate=True, sequential=None):
+    if sequential is None:
+        sequential = default_sequential()
     dom = linearize_at_previous_states(om, states)
     # dom = linearize_at_previous_states(om, inflate(states))
     if not sequential:
@@ -11,6 +11,8 @@ import jax.numpy as jnp
 import numpy as np
 import scipy
 
+from pof.utils import BlockDiagonal
+
 
 class TransitionModel(NamedTuple):
     """Linear transition model in square-root form: x' | x ~ N(Fx, QL*QLt)"""
@@ -34,6 +36,8 @@ def pascal(n):
     return jnp.array(scipy.linalg.pascal(n, kind="lower", exact=False))
 
 
+# `iwp` is a hashable static argument, so jit already memoizes this per order:
+# the scipy matrices and the Cholesky are only computed on the first trace.
 @partial(jax.jit, static_argnames="iwp")
 def preconditioned_discretize_1d(iwp: IWP):
     A_1d = jnp.flip(pascal(iwp.num_derivatives + 1))
@@ -44,39 +48,55 @@ def preconditioned_discretize_1d(iwp: IWP):
 @partial(jax.jit, static_argnames="iwp")
 def preconditioned_discretize(iwp: IWP):
     A_1d, L_Q1d = preconditioned_discretize_1d(iwp)
-    id_factor = jnp.eye(iwp.wiener_process_dimension)
-    A = jnp.kron(id_factor, A_1d)
-    L_Q = jnp.kron(id_factor, L_Q1d)
+    d = iwp.wiener_process_dimension
+    A = BlockDiagonal(A_1d, d).toarray()
+    L_Q = BlockDiagonal(L_Q1d, d).toarray()
     return A, L_Q
 
 
 @partial(jax.jit, static_argnames="iwp")
-def nordsieck_preconditioner_1d(iwp: IWP, dt: float):
+def nordsieck_scaling_1d(iwp: IWP, dt: float):
+    """Diagonals of the 1d Nordsieck preconditioner and its inverse"""
     powers = np.arange(iwp.num_derivatives, -1, -1)
     scales = jnp.array(scipy.special.factorial(powers))
     powers = powers + 0.5
 
     scaling_vector = (jnp.abs(dt) ** powers) / scales
     scaling_vector_inv = (jnp.abs(dt) ** (-powers)) * scales
+    return scaling_vector, scaling_vector_inv
+
+
+@partial(jax.jit, static_argnames="iwp")
+def nordsieck_preconditioner_1d(iwp: IWP, dt: float):
+    scaling_vector, scaling_vector_inv = nordsieck_scaling_1d(iwp, dt)
     return jnp.diag(scaling_vector), jnp.diag(scaling_vector_inv)
 
 
 @partial(jax.jit, static_argnames="iwp")
 def nordsieck_preconditioner(iwp: IWP, dt: float):
-    P, PI = nordsieck_preconditioner_1d(iwp, dt)
-    Id = jnp.eye(iwp.wiener_process_dimension)
-    return jnp.kron(Id, P), jnp.kron(Id, PI)
+    scaling_vector, scaling_vector_inv = nordsieck_scaling_1d(iwp, dt)
+    d = iwp.wiener_process_dimension
+    return jnp.diag(jnp.tile(scaling_vector, d)), jnp.diag(
+        jnp.tile(scaling_vector_inv, d)
+    )
 
 
 @partial(jax.jit, static_argnames="iwp")
-def non_preconditioned_discretize(iwp: IWP, dt: float):
-    P, PI = nordsieck_preconditioner(iwp, dt)
-    F, QL = preconditioned_discretize(iwp)
+def non_preconditioned_discretize_1d(iwp: IWP, dt: float):
+    P, PI = nordsieck_preconditioner_1d(iwp, dt)
+    F, QL = preconditioned_discretize_1d(iwp)
     state_trans_mat = P @ F @ PI
     proc_noise_cov_cholesky = P @ QL
     return (state_trans_mat, proc_noise_cov_cholesky)
 
 
+@partial(jax.jit, static_argnames="iwp")
+def non_preconditioned_discretize(iwp: IWP, dt: float):
+    F_1d, L_Q1d = non_preconditioned_discretize_1d(iwp, dt)
+    d = iwp.wiener_process_dimension
+    return BlockDiagonal(F_1d, d).toarray(), BlockDiagonal(L_Q1d, d).toarray()
+
+
 @partial(jax.jit, static_argnames=("iwp", "derivative_to_project_onto"))
 def projection_matrix_1d(iwp: IWP, derivative_to_project_onto):
     return jnp.eye(1, iwp.num_derivatives + 1, derivative_to_project_onto)
@@ -84,8 +104,8 @@ def projection_matrix_1d(iwp: IWP, derivative_to_project_onto):
 
 @partial(jax.jit, static_argnames=("iwp", "derivative_to_project_onto"))
 def projection_matrix(iwp: IWP, derivative_to_project_onto):
-    I_d = jnp.eye(iwp.wiener_process_dimension)
-    return jnp.kron(I_d, projection_matrix_1d(iwp, derivative_to_project_onto))
+    E_1d = projection_matrix_1d(iwp, derivative_to_project_onto)
+    return BlockDiagonal(E_1d, iwp.wiener_process_dimension).toarray()
 
 
 @partial(jax.jit, static_argnames=("iwp",))
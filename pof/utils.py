@@ -4,9 +4,16 @@ from typing import Any, Callable, NamedTuple
 import jax
 import jax.numpy as jnp
 import jax.scipy.linalg as jlinalg
+import numpy as np
 
 
 class MVNSqrt(NamedTuple):
+    """Gaussian N(mean, chol @ chol.T) in square-root form.
+
+    `chol` is usually a dense array, but initial states may carry a structured
+    factor (`BlockDiagonal`, `Diagonal`); use `todense` before filtering.
+    """
+
     mean: Any
     chol: Any
 
@@ -19,6 +26,148 @@ class AffineModel(NamedTuple):
         return self.A @ x + self.b
 
 
+@jax.tree_util.register_pytree_node_class
+class BlockDiagonal:
+    """Block-diagonal matrix kron(I_d, block), stored only via its single block.
+
+    Products with vectors and matrices are computed blockwise, so the dense
+    (d * r, d * c) matrix is never materialized unless `toarray` is called.
+    """
+
+    # make numpy defer to `__rmatmul__` instead of building an object array
+    __array_ufunc__ = None
+
+    def __init__(self, block, d):
+        self.block = block
+        self.d = d
+
+    def tree_flatten(self):
+        return (self.block,), self.d
+
+    @classmethod
+    def tree_unflatten(cls, d, children):
+        return cls(*children, d)
+
+    @property
+    def shape(self):
+        r, c = self.block.shape
+        return (self.d * r, self.d * c)
+
+    @property
+    def T(self):
+        return BlockDiagonal(self.block.T, self.d)
+
+    def toarray(self):
+        # scatter the block onto the diagonal; kron(I_d, block) would also
+        # compute and write all d^2 - d zero blocks
+        (r, c), idx = self.block.shape, jnp.arange(self.d)
+        dense = jnp.zeros((self.d, r, self.d, c), dtype=self.block.dtype)
+        dense = dense.at[idx, :, idx, :].set(self.block)
+        return dense.reshape(self.d * r, self.d * c)
+
+    def __matmul__(self, other):
+        if isinstance(other, BlockDiagonal):
+            assert self.d == other.d
+            return BlockDiagonal(self.block @ other.block, self.d)
+        if _is_structured(other):
+            # let e.g. `Diagonal.__rmatmul__` handle it
+            return NotImplemented
+        r, c = self.block.shape
+        out = jnp.einsum("rc,dck->drk", self.block, other.reshape(self.d, c, -1))
+        return out.reshape((self.d * r,) + other.shape[1:])
+
+    def __rmatmul__(self, other):
+        r, c = self.block.shape
+        out = other.reshape(other.shape[:-1] + (self.d, r)) @ self.block
+        return out.reshape(other.shape[:-1] + (self.d * c,))
+
+    def __add__(self, other):
+        if isinstance(other, BlockDiagonal):
+            assert self.d == other.d
+            return BlockDiagonal(self.block + other.block, self.d)
+        return self.toarray() + other
+
+    __radd__ = __add__
+
+
+@jax.tree_util.register_pytree_node_class
+class Diagonal:
+    """Diagonal matrix diag(diag); products reduce to elementwise scalings."""
+
+    __array_ufunc__ = None
+
+    def __init__(self, diag):
+        self.diag = diag
+
+    def tree_flatten(self):
+        return (self.diag,), None
+
+    @classmethod
+    def tree_unflatten(cls, _, children):
+        return cls(*children)
+
+    @property
+    def shape(self):
+        return self.diag.shape * 2
+
+    @property
+    def T(self):
+        return self
+
+    def toarray(self):
+        return jnp.diag(self.diag)
+
+    def __matmul__(self, other):
+        if isinstance(other, Diagonal):
+            return Diagonal(self.diag * other.diag)
+        if _is_structured(other):
+            other = other.toarray()
+        return self.diag.reshape((-1,) + (1,) * (other.ndim - 1)) * other
+
+    def __rmatmul__(self, other):
+        if _is_structured(other):
+            other = other.toarray()
+        return other * self.diag
+
+    def __add__(self, other):
+        if isinstance(other, Diagonal):
+            return Diagonal(self.diag + other.diag)
+        return self.toarray() + other
+
+    __radd__ = __add__
+
+
+def _is_structured(x):
+    return isinstance(x, (BlockDiagonal, Diagonal))
+
+
+def todense(x):
+    """Materialize all structured (e.g. `BlockDiagonal`) leaves of a pytree"""
+    return jax.tree_map(
+        lambda l: l.toarray() if _is_structured(l) else l, x, is_leaf=_is_structured
+    )
+
+
+def split_arrays(tree):
+    """Split a pytree into its array leaves and a hashable static remainder.
+
+    Used to pass e.g. parametrised right-hand sides through `jax.jit`: the
+    arrays are traced and only the rest needs to be hashable as a static argument.
+    """
+    leaves, treedef = jax.tree_util.tree_flatten(tree)
+    is_array = [isinstance(l, (jax.Array, np.ndarray)) for l in leaves]
+    arrays = [l if a else None for l, a in zip(leaves, is_array)]
+    static = tuple(None if a else l for l, a in zip(leaves, is_array))
+    return arrays, (treedef, static)
+
+
+def merge_arrays(arrays, static):
+    """Inverse of `split_arrays`"""
+    treedef, static_leaves = static
+    leaves = [s if a is None else a for a, s in zip(arrays, static_leaves)]
+    return jax.tree_util.tree_unflatten(treedef, leaves)
+
+
 @jax.jit
 def mvn_loglikelihood(x, chol_cov):
     dim = chol_cov.shape[0]
@@ -35,6 +184,20 @@ def tria(A):
     return qr(A.T).T
 
 
+def tria_joint(HL, L, cholR):
+    """Compute tria([[HL, cholR], [L, 0]]), as needed in the square-root update.
+
+    `cholR=None` denotes exact observations. The noise columns are then all zero,
+    so they are left out of the QR and the result is only padded with zeros.
+    """
+    ny, nx = HL.shape[0], L.shape[0]
+    if cholR is None:
+        tria_M = tria(jnp.concatenate([HL, L], axis=0))
+        n_cols = min(ny + nx, HL.shape[1] + ny)
+        return jnp.pad(tria_M, ((0, 0), (0, n_cols - tria_M.shape[1])))
+    return tria(jnp.block([[HL, cholR], [L, jnp.zeros_like(L, shape=(nx, ny))]]))
+
+
 def qr(A: jnp.ndarray):
     # return _qr(A)
     # return jlinalg.qr(A, mode="economic")[1]
@@ -104,7 +267,7 @@ def objective_function_value(mnext, m, transition_model):
 @jax.jit
 def _gmul(A: jnp.ndarray, x: MVNSqrt):
     """Multiply a Gaussian with a matrix: A * x"""
-    return jax.tree_map(lambda l: A @ l, x)
+    return jax.tree_map(lambda l: A @ l, x, is_leaf=_is_structured)
 
 
 @jax.jit
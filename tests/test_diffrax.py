@@ -1,3 +1,5 @@
+import equinox as eqx
+import jax.numpy as jnp
 import pytest
 import tornadox
 
@@ -13,3 +15,24 @@ def test_diffrax(ivp):
     sol = solve_diffrax(ivp.f, ivp.y0, ivp.t_span, rtol=1e-10, atol=1e-10)
     ts, ys = get_ts_ys(sol)
     assert ts.shape[0] == ys.shape[0]
+
+
+def test_diffrax_saveat_ts(ivp):
+    ts = jnp.linspace(ivp.t0, ivp.tmax, 10)
+    sol = solve_diffrax(ivp.f, ivp.y0, ivp.t_span, ts=ts, dtmax=0.1)
+    assert sol.ys.shape == (10, ivp.y0.shape[0])
+    assert jnp.all(sol.ts == ts)
+
+
+class VanDerPol(eqx.Module):
+    mu: jnp.ndarray
+
+    def __call__(self, t, y):
+        return jnp.stack([y[1], self.mu * ((1.0 - y[0] ** 2) * y[1] - y[0])])
+
+
+def test_diffrax_parametrised_f(ivp):
+    ts = jnp.linspace(ivp.t0, ivp.tmax, 10)
+    sol_ref = solve_diffrax(ivp.f, ivp.y0, ivp.t_span, ts=ts)
+    sol = solve_diffrax(VanDerPol(jnp.array(1e1)), ivp.y0, ivp.t_span, ts=ts)
+    assert jnp.allclose(sol.ys, sol_ref.ys)
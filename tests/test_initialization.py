@@ -27,6 +27,25 @@ def test_constant_init(ivp, order, dt):
     initial_trajectory = constant_init(y0=ivp.y0, f=ivp.f, order=order, ts=time_grid)
 
 
+@pytest.mark.parametrize("order", orders)
+@pytest.mark.parametrize("dt", dts)
+@pytest.mark.parametrize("chunk_size", [None, 3])
+def test_euler_init(ivp, order, dt, chunk_size):
+    time_grid = jnp.arange(0, ivp.tmax + dt, dt)
+    initial_trajectory = euler_init(
+        y0=ivp.y0, f=ivp.f, order=order, ts=time_grid, chunk_size=chunk_size
+    )
+    assert initial_trajectory.mean.shape[0] == len(time_grid)
+
+    ys = initial_trajectory.mean[:, :: order + 1]
+    dys = initial_trajectory.mean[:, 1 :: order + 1]
+    fs = jax.vmap(ivp.f, in_axes=(None, 0))(None, ys)
+    assert jnp.all(ys[0] == ivp.y0)
+    assert jnp.allclose(ys[1], ivp.y0 + dt * ivp.f(None, ivp.y0))
+    assert jnp.allclose(ys[1:] - ys[:-1], jnp.diff(time_grid)[:, None] * fs[:-1])
+    assert jnp.allclose(dys, fs)
+
+
 @pytest.mark.parametrize("order", orders)
 @pytest.mark.parametrize("dt", dts)
 def test_prior_init(ivp, order, dt):
@@ -64,6 +83,50 @@ def test_coarse_ekf_init(ivp, order, dt):
 
 @pytest.mark.parametrize("order", orders)
 @pytest.mark.parametrize("dt", dts)
-def test_coarse_rk_init(ivp, order, dt):
+@pytest.mark.parametrize("chunk_size", [None, 3])
+def test_coarse_rk_init(ivp, order, dt, chunk_size):
     ts = jnp.arange(ivp.t0, ivp.tmax + dt, dt)
-    initial_trajectory = coarse_rk_init(f=ivp.f, y0=ivp.y0, order=order, ts=ts)
+    initial_trajectory = coarse_rk_init(
+        f=ivp.f, y0=ivp.y0, order=order, ts=ts, chunk_size=chunk_size
+    )
+
+
+@pytest.mark.parametrize("order", orders)
+def test_uncertain_init(ivp, order):
+    x0 = uncertain_init(ivp.f, ivp.y0, order, var=4.0)
+    d = ivp.y0.shape[0]
+    D = d * (order + 1)
+    assert x0.mean.shape == (D,)
+    assert x0.chol.shape == (D, D)
+
+    chol = pof.utils.todense(x0).chol
+    stds = jnp.diag(chol).reshape(d, order + 1)
+    assert jnp.all(stds[:, :2] == 0)
+    assert jnp.all(stds[:, 2:] == 2.0)
+    assert jnp.all(chol == jnp.diag(jnp.diag(chol)))
+
+    iwp = IWP(num_derivatives=order, wiener_process_dimension=d)
+    dtm = discretize_transitions(iwp, steps=jnp.full(3, 0.1))
+    states = _prior_init(x0=x0, dtm=dtm)
+    states_dense = _prior_init(x0=pof.utils.todense(x0), dtm=dtm)
+    assert jnp.allclose(states.mean, states_dense.mean)
+    assert jnp.allclose(states.chol, states_dense.chol)
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 4, 100])
+def test_classic_to_init(ivp, chunk_size):
+    ys = jnp.linspace(0.1, 0.9, 10)[:, None]
+    traj = classic_to_init(ys=ys, order=2, f=ivp.f, chunk_size=chunk_size)
+    assert traj.mean.shape == (10, 3)
+    assert jnp.allclose(traj.mean[:, 0], ys[:, 0])
+    assert jnp.allclose(
+        traj.mean[:, 1], jax.vmap(ivp.f, in_axes=(None, 0))(None, ys)[:, 0]
+    )
+    assert jnp.all(traj.mean[:, 2] == 0)
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1])
+def test_classic_to_init_invalid_chunk_size(ivp, chunk_size):
+    ys = jnp.linspace(0.1, 0.9, 10)[:, None]
+    with pytest.raises(ValueError):
+        classic_to_init(ys=ys, order=2, f=ivp.f, chunk_size=chunk_size)
@@ -0,0 +1,19 @@
+import jax.numpy as jnp
+import pytest
+
+from pof.iterators import admm_ieks_iterator, ieks_iterator
+from pof.ivp import logistic
+
+
+@pytest.fixture
+def ivp():
+    return logistic()
+
+
+@pytest.mark.parametrize("iterator", [ieks_iterator, admm_ieks_iterator])
+def test_iterator_converges(ivp, iterator):
+    time_grid = jnp.arange(0, ivp.tmax + 0.5, 0.5)
+    it, setup = iterator(f=ivp.f, y0=ivp.y0, ts=time_grid, order=2)
+    for i, (states, *_) in enumerate(it):
+        assert i < 100
+    assert states.mean.shape[0] == len(time_grid)
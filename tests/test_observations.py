@@ -27,7 +27,6 @@ def test_linearize(nlm):
     assert isinstance(linearized_model, AffineModel)
     assert H.shape == (1, 1)
     assert b.shape == (1,)
-    assert cholR.shape == (1, 1)
-    assert all(cholR == 0)
+    assert cholR is None
 
     assert H @ x.mean + b == nlm(x.mean)
@@ -1,3 +1,4 @@
+import equinox as eqx
 import jax.numpy as jnp
 import pytest
 
@@ -11,14 +12,41 @@ def ivp():
 
 
 @pytest.mark.parametrize("order", [1, 3])
-@pytest.mark.parametrize("init", ["constant", "prior"])
+@pytest.mark.parametrize("init", ["constant", "euler", "prior"])
 @pytest.mark.parametrize("dt", [0.5])
-def test_full_solve(ivp, order, init, dt):
+@pytest.mark.parametrize("sequential", [None, True, False])
+def test_full_solve(ivp, order, init, dt, sequential):
     time_grid = jnp.arange(0, ivp.tmax + dt, dt)
-    out, info = solve(f=ivp.f, y0=ivp.y0, ts=time_grid, order=order, init=init)
+    out, info = solve(
+        f=ivp.f,
+        y0=ivp.y0,
+        ts=time_grid,
+        order=order,
+        init=init,
+        sequential=sequential,
+    )
     assert out.mean.shape[0] == len(time_grid)
 
 
+class Logistic(eqx.Module):
+    rate: jnp.ndarray
+
+    def __call__(self, t, y):
+        return self.rate * y * (1 - y)
+
+
+def test_solve_parametrised_f(ivp):
+    time_grid = jnp.arange(0, ivp.tmax + 0.5, 0.5)
+    kwargs = dict(y0=ivp.y0, ts=time_grid, order=2, init="constant")
+    out_ref, _ = solve(f=ivp.f, **kwargs)
+    out, _ = solve(f=Logistic(jnp.array(1.0)), **kwargs)
+    assert jnp.allclose(out.mean, out_ref.mean)
+
+    # new parameter values are traced, not baked into the compiled solve
+    out_fast, _ = solve(f=Logistic(jnp.array(2.0)), **kwargs)
+    assert not jnp.allclose(out_fast.mean, out.mean)
+
+
 @pytest.mark.parametrize("order", [1, 3])
 @pytest.mark.parametrize("dt", [0.5])
 def test_sequential_solve(ivp, order, dt):
@@ -6,6 +6,9 @@ from pof.transitions import (
     IWP,
     TransitionModel,
     get_transition_model,
+    non_preconditioned_discretize,
+    nordsieck_preconditioner,
+    preconditioned_discretize,
     projection_matrix,
 )
 
@@ -42,3 +45,14 @@ def test_discretize():
     F, QL = tm
     assert F.shape == (D, D)
     assert QL.shape == (D, D)
+
+
+def test_non_preconditioned_discretize():
+    d, q = 2, 3
+    iwp = IWP(num_derivatives=q, wiener_process_dimension=d)
+    dt = 0.1
+    P, PI = nordsieck_preconditioner(iwp, dt)
+    F, QL = preconditioned_discretize(iwp)
+    F_np, QL_np = non_preconditioned_discretize(iwp, dt)
+    assert jnp.allclose(F_np, P @ F @ PI)
+    assert jnp.allclose(QL_np, P @ QL)
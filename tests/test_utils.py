@@ -0,0 +1,70 @@
+import jax
+import jax.numpy as jnp
+import numpy as np
+import pytest
+
+from pof.utils import BlockDiagonal, Diagonal, MVNSqrt, _gmul, todense, tria_joint
+
+
+@pytest.fixture
+def block():
+    return jnp.array(np.random.uniform(size=(3, 4)))
+
+
+@pytest.mark.parametrize("d", [1, 3])
+def test_blockdiagonal_matmul(block, d):
+    B = BlockDiagonal(block, d)
+    dense = jnp.kron(jnp.eye(d), block)
+    assert B.shape == dense.shape
+    assert jnp.allclose(B.toarray(), dense)
+
+    x = jnp.array(np.random.uniform(size=(4 * d,)))
+    X = jnp.array(np.random.uniform(size=(4 * d, 5)))
+    Y = jnp.array(np.random.uniform(size=(5, 3 * d)))
+    assert jnp.allclose(B @ x, dense @ x)
+    assert jnp.allclose(B @ X, dense @ X)
+    assert jnp.allclose(Y @ B, Y @ dense)
+    assert jnp.allclose(B.T.toarray(), dense.T)
+    assert jnp.allclose((B @ B.T).toarray(), dense @ dense.T)
+    assert jnp.allclose((B + B).toarray(), 2 * dense)
+
+
+def test_blockdiagonal_pytree(block):
+    B = BlockDiagonal(block, 2)
+    x = MVNSqrt(jnp.ones(8), BlockDiagonal(jnp.eye(4), 2))
+    out = jax.jit(_gmul)(B, x)
+    assert isinstance(out.chol, BlockDiagonal)
+    out = todense(out)
+    assert out.mean.shape == (6,)
+    assert out.chol.shape == (6, 8)
+
+
+def test_diagonal_matmul(block):
+    v = jnp.array(np.random.uniform(size=(8,)))
+    D = Diagonal(v)
+    dense = jnp.diag(v)
+    assert D.shape == dense.shape
+    assert jnp.allclose(D.toarray(), dense)
+
+    x = jnp.array(np.random.uniform(size=(8,)))
+    X = jnp.array(np.random.uniform(size=(8, 5)))
+    assert jnp.allclose(D @ x, dense @ x)
+    assert jnp.allclose(D @ X, dense @ X)
+    assert jnp.allclose(X.T @ D, X.T @ dense)
+    assert jnp.allclose((D @ D).toarray(), dense @ dense)
+
+    B = BlockDiagonal(block.T, 2)
+    assert jnp.allclose(D @ B, dense @ B.toarray())
+    assert jnp.allclose(B.T @ D, B.T.toarray() @ dense)
+
+
+@pytest.mark.parametrize("nL", [0, 4])
+def test_tria_joint_exact(nL):
+    ny, nx = 2, 4
+    HL = jnp.array(np.random.randn(ny, nx))
+    L = jnp.array(np.random.randn(nL, nx))
+    T_exact = tria_joint(HL, L, None)
+    T_zeros = tria_joint(HL, L, jnp.zeros((ny, ny)))
+    assert T_exact.shape == T_zeros.shape
+    # equal up to the signs of the columns
+    assert jnp.allclose(jnp.abs(T_exact), jnp.abs(T_zeros), atol=1e-6)